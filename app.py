@@ -1,25 +1,133 @@
 import gradio as gr
-import folium
-from folium import plugins
+import ijson
+import orjson
 import requests
 from requests.auth import HTTPBasicAuth
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
+from collections import Counter
 import time
+import functools
+import threading
 import numpy as np
+from numba import njit
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import os
+import tempfile
 USERNAME = os.getenv("ID_AUTH")
 PASSWORD = os.getenv("PW_AUTH")
+# STREAM_JSON=1 parses the body with ijson while it downloads; the default
+# downloads it in full and parses it with orjson, which costs less CPU
+STREAM_JSON = os.getenv("STREAM_JSON", "0") == "1"
+
+# seconds a fetched payload / rendered map stays fresh per region
+CACHE_TTL = 10
+_cache_lock = threading.Lock()
+_states_cache = {}
+_render_cache = {}
+# one lock per region so concurrent misses share a single OpenSky fetch
+_fetch_locks = {}
+# rendered maps are written here and served through Gradio's file route
+MAP_DIR = os.path.join(tempfile.gettempdir(), "aircraft_maps")
+os.makedirs(MAP_DIR, exist_ok=True)
+
+REGION_BOUNDS = {
+    "world": None,
+    "europe": {"lamin": 35.0, "lomin": -15.0, "lamax": 60.0, "lomax": 40.0},
+    "north_america": {"lamin": 25.0, "lomin": -130.0, "lamax": 50.0, "lomax": -60.0},
+    "asia": {"lamin": 10.0, "lomin": 60.0, "lamax": 50.0, "lomax": 150.0}
+}
+WORLD_BOUNDS = {"lamin": -90.0, "lomin": -180.0, "lamax": 90.0, "lomax": 180.0}
+
+# below this many aircraft the heatmap gets raw points; above, 1° grid cells
+HEATMAP_BIN_THRESHOLD = 500
+HEATMAP_BINS = (180, 360)
+
+# standalone Leaflet page; create_map only fills in the two JSON payloads
+LEAFLET_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <meta http-equiv="content-type" content="text/html; charset=UTF-8" />
+    <meta name="viewport" content="width=device-width, initial-scale=1.0" />
+    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/leaflet@1.9.3/dist/leaflet.css"/>
+    <script src="https://cdn.jsdelivr.net/npm/leaflet@1.9.3/dist/leaflet.js"></script>
+    <script src="https://cdn.jsdelivr.net/gh/python-visualization/folium@v0.20.0/folium/templates/leaflet_heat.min.js"></script>
+    <style>
+        html, body, #map { width: 100%; height: 100%; margin: 0; padding: 0; }
+        .empty { background: none; border: none; }
+    </style>
+</head>
+<body>
+<div id="map"></div>
+<script>
+    var map = L.map("map", {center: [30.0, 0.0], zoom: 3});
+    L.tileLayer("https://{s}.basemaps.cartocdn.com/dark_all/{z}/{x}/{y}{r}.png", {
+        attribution: '&copy; <a href="https://www.openstreetmap.org/copyright">OpenStreetMap</a> contributors &copy; <a href="https://carto.com/attributions">CARTO</a>',
+        subdomains: "abcd",
+        maxZoom: 20
+    }).addTo(map);
+
+    // rotated plane icon and popup are built in the browser, once per feature
+    L.geoJson({{GEOJSON}}, {
+        onEachFeature: function(feature, layer) {
+            var p = feature.properties;
+            layer.setIcon(L.divIcon({
+                html: '<div style="transform: rotate(' + (p.true_track || 0) + 'deg)">✈️</div>',
+                iconSize: [20, 20],
+                className: 'empty'
+            }));
+            layer.bindPopup(
+                '<div style="font-family: Arial; width: 200px;">' +
+                '<h4 style="color: #4a90e2;">Flight Information</h4>' +
+                '<p><b>Callsign:</b> ' + (p.callsign || 'N/A') + '</p>' +
+                '<p><b>Altitude:</b> ' + (p.altitude != null ? p.altitude : 'N/A') + 'm</p>' +
+                '<p><b>Velocity:</b> ' + (p.velocity != null ? p.velocity : 'N/A') + 'm/s</p>' +
+                '<p><b>Origin:</b> ' + p.origin_country + '</p>' +
+                '</div>',
+                {maxWidth: 300}
+            );
+        }
+    }).addTo(map);
+
+    L.heatLayer({{HEAT}}, {minOpacity: 0.5, maxZoom: 18, radius: 15, blur: 15}).addTo(map);
+</script>
+</body>
+</html>
+"""
  
 class OpenSkyApi:
-    def __init__(self, username=None, password=None):
+    def __init__(self, username=None, password=None, stream=False):
         self.auth = HTTPBasicAuth(username, password) if username and password else None
         self.base_url = "https://opensky-network.org/api"
+        self.stream = stream
+
+        # one pooled keep-alive connection reused across refreshes
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0',
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip'
+        })
+        retries = Retry(
+            total=3,
+            backoff_factor=1,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False
+        )
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries)
+        )
     
     def get_states(self, time_secs=0, icao24=None, bbox=None):
-        """Retrieve state vectors for a given time."""
+        """Retrieve state vectors for a given time.
+
+        When self.stream is set, the body is parsed by ijson as it arrives;
+        otherwise it is downloaded in full and parsed with orjson.
+        """
         params = {"time": int(time_secs) if time_secs else int(time.time())}
         
         if icao24:
@@ -32,105 +140,179 @@ class OpenSkyApi:
                 "lomax": bbox[3]
             })
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0',
-            'Accept': 'application/json'
-        }
-        
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/states/all",
                 params=params,
-                auth=self.auth,
-                headers=headers,
-                timeout=15
+                timeout=15,
+                stream=self.stream
             )
             
-            if response.status_code == 200:
-                return StateVector(response.json())
-            elif response.status_code == 401:
-                print("Authentication failed. Please check your environment variables ID_AUTH and PW_AUTH.")
-                return None
-            else:
-                print(f"Error {response.status_code}: {response.text}")
-                return None
+            # closing releases the pooled connection, which a streamed
+            # response otherwise keeps until its body is read
+            with response:
+                if response.status_code == 200:
+                    if not self.stream:
+                        return StateVector(orjson.loads(response.content))
+                    response.raw.decode_content = True
+                    # top-level pairs in order: "time" arrives before "states"
+                    return StateVector(dict(ijson.kvitems(response.raw, '', use_float=True)))
+                elif response.status_code == 401:
+                    print("Authentication failed. Please check your environment variables ID_AUTH and PW_AUTH.")
+                    return None
+                else:
+                    print(f"Error {response.status_code}: {response.text}")
+                    return None
         except Exception as e:
             print(f"Error fetching data: {e}")
             return None
 
 class StateVector:
+    """Columnar view of an OpenSky /states/all payload (one numpy array per field).
+
+    Numeric columns are float32: ~7 significant digits is plenty for plotting
+    positions and halves the memory the aggregation passes walk over.
+    """
     def __init__(self, states_json):
         self.time = states_json.get('time', 0)
-        self.states = []
-        
-        if states_json.get('states'):
-            for state in states_json['states']:
-                self.states.append(State(state))
-
-class State:
-    def __init__(self, state_array):
-        self.icao24 = state_array[0]
-        self.callsign = state_array[1]
-        self.origin_country = state_array[2]
-        self.time_position = state_array[3]
-        self.last_contact = state_array[4]
-        self.longitude = state_array[5]
-        self.latitude = state_array[6]
-        self.geo_altitude = state_array[7]
-        self.on_ground = state_array[8]
-        self.velocity = state_array[9]
-        self.true_track = state_array[10]
-        self.vertical_rate = state_array[11]
-        self.sensors = state_array[12] if len(state_array) > 12 else None
-        self.baro_altitude = state_array[13] if len(state_array) > 13 else None
-        self.squawk = state_array[14] if len(state_array) > 14 else None
-        self.spi = state_array[15] if len(state_array) > 15 else None
-        self.position_source = state_array[16] if len(state_array) > 16 else None
-
-api = OpenSkyApi(USERNAME, PASSWORD)
-
-def get_states(bounds=None, max_retries=3):
-    """Get current aircraft states from OpenSky Network with retry logic"""
-    for attempt in range(max_retries):
-        try:
-            if bounds:
-                bbox = (
-                    bounds['lamin'],
-                    bounds['lamax'],
-                    bounds['lomin'],
-                    bounds['lomax']
-                )
-                states = api.get_states(bbox=bbox)
-            else:
-                states = api.get_states()
-            
-            if states and states.states:
-                return {'states': states.states}
-            
-            if attempt < max_retries - 1:
-                wait_time = min(2 ** attempt, 60)
-                print(f"Retrying in {wait_time} seconds...")
-                time.sleep(wait_time)
-                continue
-            return None
-                
-        except Exception as e:
-            print(f"Error fetching data: {e}")
-            if attempt < max_retries - 1:
-                time.sleep(5)
-                continue
-            return None
+        rows = states_json.get('states') or []
+        # only the scalar fields; index 12 (sensors) may be a nested list
+        arr = np.array([row[:12] for row in rows], dtype=object).reshape(-1, 12)
+
+        self.icao24 = arr[:, 0]
+        self.callsign = arr[:, 1]
+        self.origin_country = arr[:, 2]
+        self.time_position = arr[:, 3]
+        self.last_contact = arr[:, 4]
+        self.longitude = arr[:, 5].astype(np.float32)
+        self.latitude = arr[:, 6].astype(np.float32)
+        self.geo_altitude = arr[:, 7].astype(np.float32)
+        self.on_ground = arr[:, 8]
+        self.velocity = arr[:, 9].astype(np.float32)
+        self.true_track = arr[:, 10].astype(np.float32)
+        self.vertical_rate = arr[:, 11].astype(np.float32)
+
+    def __len__(self):
+        return self.icao24.shape[0]
+
+api = OpenSkyApi(USERNAME, PASSWORD, stream=STREAM_JSON)
+
+def get_states(bounds=None):
+    """Get current aircraft states from OpenSky Network (retries happen in the session)"""
+    if bounds:
+        # same (lamin, lamax, lomin, lomax) order OpenSkyApi.get_states unpacks
+        bbox = (
+            bounds['lamin'],
+            bounds['lamax'],
+            bounds['lomin'],
+            bounds['lomax']
+        )
+        states = api.get_states(bbox=bbox)
+    else:
+        states = api.get_states()
+
+    if states and len(states):
+        return states
     return None
 
-def create_monitoring_dashboard(states):
-    """Create monitoring dashboard using Plotly"""
+def get_cached_states(region):
+    """Get aircraft states for a region, reusing a payload younger than CACHE_TTL"""
+    with _cache_lock:
+        cached = _states_cache.get(region)
+        if cached and time.time() - cached[0] < CACHE_TTL:
+            return cached[1]
+        fetch_lock = _fetch_locks.setdefault(region, threading.Lock())
+
+    with fetch_lock:
+        # another session may have filled the cache while we waited
+        with _cache_lock:
+            cached = _states_cache.get(region)
+            if cached and time.time() - cached[0] < CACHE_TTL:
+                return cached[1]
+
+        data = get_states(REGION_BOUNDS.get(region))
+        if data:
+            with _cache_lock:
+                _states_cache[region] = (time.time(), data)
+        return data
+
+# serial on purpose: called from concurrent Gradio workers, where numba's
+# default workqueue threading layer aborts on concurrent parallel entry
+@njit(cache=True)
+def aggregate_positions(lat, lon, alt, clip, lamin, lamax, lomin, lomax, bins_lat, bins_lon):
+    """Mask positioned aircraft (inside the bbox when clip is set), count them
+    per world grid cell and average their altitude in one pass"""
+    n = lat.shape[0]
+    cell = np.full(n, -1, np.int64)
+    alt_sum = 0.0
+    alt_n = 0
+    for i in range(n):
+        if np.isnan(lat[i]) or np.isnan(lon[i]):
+            continue
+        # safety net only: OpenSky already applied the same bbox server-side
+        if clip and (lat[i] < lamin or lat[i] > lamax or lon[i] < lomin or lon[i] > lomax):
+            continue
+        iy = max(min(int((lat[i] + 90.0) * bins_lat / 180.0), bins_lat - 1), 0)
+        ix = max(min(int((lon[i] + 180.0) * bins_lon / 360.0), bins_lon - 1), 0)
+        cell[i] = iy * bins_lon + ix
+        if not np.isnan(alt[i]):
+            alt_sum += alt[i]
+            alt_n += 1
+
+    counts = np.bincount(cell[cell >= 0], minlength=bins_lat * bins_lon)
+
+    avg_alt = alt_sum / alt_n if alt_n > 0 else 0.0
+    return counts.reshape(bins_lat, bins_lon), cell >= 0, avg_alt
+
+# compile at import so the first request doesn't pay for it; cache=True rarely
+# survives a fresh container
+_no_positions = np.empty(0, dtype=np.float32)
+aggregate_positions(
+    _no_positions, _no_positions, _no_positions, False,
+    *(np.float32(0.0) for _ in range(4)), *HEATMAP_BINS
+)
+
+def heatmap_points(lat, lon, grid):
+    """Return [lat, lon, weight] triples, taken from the pre-binned grid for large N"""
+    if lat.size < HEATMAP_BIN_THRESHOLD:
+        return np.column_stack([lat, lon, np.ones_like(lat)]).astype(np.float64).round(5).tolist()
+
+    iy, ix = np.nonzero(grid)
+    lat_centers = -90.0 + (iy + 0.5) * 180.0 / grid.shape[0]
+    lon_centers = -180.0 + (ix + 0.5) * 360.0 / grid.shape[1]
+    return np.column_stack([lat_centers, lon_centers, grid[iy, ix]]).tolist()
+
+def histogram_bar(values, bins=50, **kwargs):
+    """Bin values with numpy and return a go.Bar, so only bin counts reach the browser"""
+    counts, edges = np.histogram(values, bins=bins)
+    centers = (edges[:-1] + edges[1:]) / 2
+    return go.Bar(x=centers, y=counts, width=np.diff(edges), **kwargs)
+
+def create_monitoring_dashboard(states, country_counts=None, mask=None):
+    """Create monitoring dashboard using Plotly
+
+    mask restricts it to a subset of aircraft; country_counts is an optional
+    Counter already computed over that same subset.
+    """
     if not states:
         return go.Figure()
 
-    altitudes = [s.geo_altitude for s in states if s.geo_altitude is not None]
-    speeds = [s.velocity for s in states if s.velocity is not None]
-    countries = pd.Series([s.origin_country for s in states if s.origin_country])
-    
+    if mask is None:
+        mask = np.ones(len(states), dtype=np.bool_)
+    altitudes = states.geo_altitude[mask & np.isfinite(states.geo_altitude)]
+    speeds = states.velocity[mask & np.isfinite(states.velocity)]
+    if country_counts is None:
+        country_counts = Counter(c for c in states.origin_country[mask] if c)
+    top_countries = tuple(country_counts.most_common(10))
+    # keyed on content only (raw bytes keep it hashable and exact): a refetch
+    # after CACHE_TTL that returns the same data reuses the figure
+    return _dashboard(altitudes.tobytes(), speeds.tobytes(), top_countries)
+
+@functools.lru_cache(maxsize=8)
+def _dashboard(altitude_bytes, speed_bytes, top_countries):
+    """Build the dashboard figure; only called on a cache miss"""
+    altitudes = np.frombuffer(altitude_bytes, dtype=np.float32)
+    speeds = np.frombuffer(speed_bytes, dtype=np.float32)
 
     fig = make_subplots(
         rows=2, cols=2,
@@ -142,20 +324,20 @@ def create_monitoring_dashboard(states):
         ]
     )
     fig.add_trace(
-        go.Histogram(x=altitudes, name="Altitude", marker_color='#4a90e2'),
+        histogram_bar(altitudes, name="Altitude", marker_color='#4a90e2'),
         row=1, col=1
     )
     
     fig.add_trace(
-        go.Histogram(x=speeds, name="Speed", marker_color='#50C878'),
+        histogram_bar(speeds, name="Speed", marker_color='#50C878'),
         row=1, col=2
     )
     
-    top_countries = countries.value_counts().head(10)
+    labels, counts = zip(*top_countries) if top_countries else ((), ())
     fig.add_trace(
         go.Bar(
-            x=top_countries.index,
-            y=top_countries.values,
+            x=labels,
+            y=counts,
             name="Countries",
             marker_color='#FF6B6B'
         ),
@@ -197,79 +379,120 @@ def create_monitoring_dashboard(states):
 
     return fig
 
-def create_map(region="world"):
-    """Create aircraft tracking map"""
-    m = folium.Map(
-        location=[30, 0],
-        zoom_start=3,
-        tiles='CartoDB dark_matter'
+def _inline_json(value):
+    """Serialise value for embedding inside a <script> block"""
+    return orjson.dumps(value).decode().replace("</", "<\\/")
+
+def map_iframe(features, heat, region):
+    """Render the Leaflet page to MAP_DIR and return an iframe that loads it from Gradio"""
+    html = (
+        LEAFLET_TEMPLATE
+        # heat first: it is purely numeric, so it cannot contain the other placeholder
+        .replace("{{HEAT}}", _inline_json(heat))
+        .replace("{{GEOJSON}}", _inline_json({"type": "FeatureCollection", "features": features}))
+    )
+    path = os.path.join(MAP_DIR, f"map_{region}.html")
+    # write-then-rename so a concurrent request never serves a half-written file
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(html)
+    os.replace(tmp_path, path)
+    return (
+        f'<iframe src="/gradio_api/file={path}?t={time.time():.0f}" '
+        'width="100%" height="700" style="border: none;"></iframe>'
     )
 
-    bounds = {
-        "world": None,
-        "europe": {"lamin": 35.0, "lomin": -15.0, "lamax": 60.0, "lomax": 40.0},
-        "north_america": {"lamin": 25.0, "lomin": -130.0, "lamax": 50.0, "lomax": -60.0},
-        "asia": {"lamin": 10.0, "lomin": 60.0, "lamax": 50.0, "lomax": 150.0}
-    }
+def create_map(region="world"):
+    """Create aircraft tracking map, yielding (map, dashboard, stats) as each part is ready
+
+    Parts not built yet are gr.update() placeholders, so the cheap stats reach
+    the UI before the dashboard and the map.
+    """
+    # read under the lock but never yield while holding it: the generator
+    # pauses at each yield until Gradio resumes it
+    with _cache_lock:
+        cached = _render_cache.get(region)
+    if cached and time.time() - cached[0] < CACHE_TTL:
+        yield cached[1]
+        return
 
-    data = get_states(bounds.get(region))
+    data = get_cached_states(region)
     
-    if not data or not data['states']:
-        return (
-            m._repr_html_(), 
-            create_monitoring_dashboard([]),
+    if not data:
+        yield (
+            map_iframe([], [], region), 
+            create_monitoring_dashboard(None),
             "No data available. Please try again later."
         )
+        return
 
-    states = data['states']
-    heat_data = []
+    states = data
+    bounds = REGION_BOUNDS.get(region)
+    clip = bounds is not None
+    bounds = bounds or WORLD_BOUNDS
+    grid, positioned, avg_altitude = aggregate_positions(
+        states.latitude, states.longitude, states.geo_altitude, clip,
+        *(np.float32(bounds[k]) for k in ('lamin', 'lamax', 'lomin', 'lomax')),
+        *HEATMAP_BINS
+    )
 
-    for state in states:
-        if state.latitude and state.longitude:
-            lat, lon = state.latitude, state.longitude
-            callsign = state.callsign if state.callsign else 'N/A'
-            altitude = state.geo_altitude if state.geo_altitude else 'N/A'
-            velocity = state.velocity if state.velocity else 'N/A'
-            
-            heat_data.append([lat, lon, 1])
-            
-            popup_content = f"""
-            <div style="font-family: Arial; width: 200px;">
-                <h4 style="color: #4a90e2;">Flight Information</h4>
-                <p><b>Callsign:</b> {callsign}</p>
-                <p><b>Altitude:</b> {altitude}m</p>
-                <p><b>Velocity:</b> {velocity}m/s</p>
-                <p><b>Origin:</b> {state.origin_country}</p>
-            </div>
-            """
-            
-            folium.Marker(
-                location=[lat, lon],
-                popup=folium.Popup(popup_content, max_width=300),
-                icon=folium.DivIcon(
-                    html=f'''
-                        <div style="transform: rotate({state.true_track if state.true_track else 0}deg)">✈️</div>
-                    ''',
-                    icon_size=(20, 20)
-                )
-            ).add_to(m)
-
-    plugins.HeatMap(heat_data, radius=15).add_to(m)
-    
     total_aircraft = len(states)
-    countries = len(set(s.origin_country for s in states if s.origin_country))
-    avg_altitude = np.mean([s.geo_altitude for s in states if s.geo_altitude is not None]) if states else 0
+    # the remaining stats and the dashboard describe the plotted (positioned,
+    # in-region) aircraft, the same population the kernel's average altitude covers
+    aircraft_on_map = int(positioned.sum())
+    # one pass over the country column serves both the stats and the dashboard
+    country_counts = Counter(c for c in states.origin_country[positioned] if c)
+    countries = len(country_counts)
     
     stats = f"""
     Real-time Statistics:
     • Total Aircraft: {total_aircraft}
-    • Countries: {countries}
-    • Average Altitude: {avg_altitude:.0f}m
+    • Aircraft on Map: {aircraft_on_map}
+    • Countries (on map): {countries}
+    • Average Altitude (on map): {avg_altitude:.0f}m
     
     Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
     """
+    yield gr.update(), gr.update(), stats
+
+    dashboard = create_monitoring_dashboard(states, country_counts, positioned)
+    yield gr.update(), dashboard, stats
+
+    lat = states.latitude[positioned]
+    lon = states.longitude[positioned]
+
+    # widen before rounding so float32 noise does not leak into the JSON
+    def _nullable(values):
+        return np.where(np.isnan(values), None, values.astype(np.float64).round(1)).tolist()
+
+    features = [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [x, y]},
+            "properties": {
+                "callsign": callsign,
+                "origin_country": country,
+                "altitude": altitude,
+                "velocity": velocity,
+                "true_track": track
+            }
+        }
+        for x, y, callsign, country, altitude, velocity, track in zip(
+            lon.astype(np.float64).round(5).tolist(),
+            lat.astype(np.float64).round(5).tolist(),
+            states.callsign[positioned].tolist(),
+            states.origin_country[positioned].tolist(),
+            _nullable(states.geo_altitude[positioned]),
+            _nullable(states.velocity[positioned]),
+            _nullable(states.true_track[positioned])
+        )
+    ]
+    heat = heatmap_points(lat, lon, grid)
 
-    return m._repr_html_(), create_monitoring_dashboard(states), stats
+    result = (map_iframe(features, heat, region), dashboard, stats)
+    with _cache_lock:
+        _render_cache[region] = (time.time(), result)
+    yield result
 
 # csssssss 
 custom_css = """
@@ -315,10 +538,10 @@ with gr.Blocks(css=custom_css) as demo:
     
     def update_map(region):
         try:
-            return create_map(region)
+            yield from create_map(region)
         except Exception as e:
             print(f"Error updating map: {e}")
-            return (
+            yield (
                 "<p>Map loading failed. Please try again.</p>",
                 go.Figure(),
                 f"Error: {str(e)}"
@@ -342,9 +565,13 @@ if not USERNAME or not PASSWORD:
     print("Warning: Environment variables ID_AUTH and/or PW_AUTH are not set.")
     print("The application will run with anonymous access, which has lower rate limits.")
 
+# up to 4 create_map generators run at once; everything they share is
+# lock-guarded and aggregate_positions is a serial (thread-safe) kernel
+demo.queue(default_concurrency_limit=4)
 demo.launch(
     show_error=True,
     server_name="0.0.0.0",
     server_port=7860,
-    share=False
+    share=False,
+    allowed_paths=[MAP_DIR]
 )
\ No newline at end of file